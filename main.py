@@ -1,37 +1,64 @@
-
+import time
+BOOT_STARTED = time.perf_counter()
 
 import asyncio
+import json
+import logging
 import os
-from aiogram import Bot, Dispatcher, types, F
-from aiogram.fsm.context import FSMContext
-from aiogram.fsm.state import State, StatesGroup
-from aiogram.fsm.storage.memory import MemoryStorage
-from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton, CallbackQuery
-from dotenv import load_dotenv
-from flask import Flask
 from threading import Thread
 
-# 🌐 Flask-сервер для Render
-app = Flask(__name__)
-
-@app.route("/")
-def home():
-    return "Bot is running!"
+logging.basicConfig(level=logging.INFO)
+boot_log = logging.getLogger("boot")
+_phase_started = BOOT_STARTED
 
-@app.route("/ping")
-def ping():
-    return "OK", 200
+def mark_phase(name):
+    """Логує тривалість фази запуску і загальний час від старту процесу."""
+    global _phase_started
+    now = time.perf_counter()
+    boot_log.info("⏱ %s: %.0f мс (від старту %.0f мс)",
+                  name, (now - _phase_started) * 1000, (now - BOOT_STARTED) * 1000)
+    _phase_started = now
 
+# 🌐 Flask-сервер для Render (імпортується у власному потоці, щоб не блокувати бота)
 def run_flask():
+    from flask import Flask
+
+    app = Flask(__name__)
+
+    @app.route("/")
+    def home():
+        return "Bot is running!"
+
+    @app.route("/ping")
+    def ping():
+        return "OK", 200
+
     app.run(host="0.0.0.0", port=8080)
 
 Thread(target=run_flask).start()
+mark_phase("старт Flask-потоку")
 
 # 🤖 Telegram
+from aiogram import Bot, Dispatcher, types, F
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.fsm.context import FSMContext
+from aiogram.fsm.state import State, StatesGroup
+from aiogram.fsm.storage.memory import MemoryStorage
+from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton, CallbackQuery
+from dotenv import load_dotenv
+mark_phase("імпорт aiogram")
+
 load_dotenv()
 TOKEN = os.getenv("TOKEN")
-bot = Bot(token=TOKEN)
+# Скільки з'єднань з Bot API відкрити заздалегідь і як довго тримати їх живими
+WARM_CONNECTIONS = int(os.getenv("WARM_CONNECTIONS", "4"))
+KEEPALIVE_SECONDS = int(os.getenv("KEEPALIVE_SECONDS", "75"))
+
+session = AiohttpSession(limit=100)
+session._connector_init["keepalive_timeout"] = KEEPALIVE_SECONDS
+bot = Bot(token=TOKEN, session=session)
 dp = Dispatcher(storage=MemoryStorage())
+mark_phase("створення бота")
 
 class QuizState(StatesGroup):
     question_index = State()
@@ -39,454 +66,22 @@ class QuizState(StatesGroup):
     temp_selected = State()
     current_message_id = State()
 
-#
-questions = [
-    {
-        "text": "1) Яких елементів не вистачає на платі KeyPad?",
-        "image": "https://raw.githubusercontent.com/80casper08/Hardtest2.0/main/images/1.jpg",
-        "options": [
-            ("Холдер '-'", True),
-            ("Холдер '+'", True),
-            ("Резистор", False),
-            ("Світлодіод", False)
-        ]
-    },
-    {
-        "text": "2) Яких елементів не вистачає на платі StreetSiren?",
-        "image": "https://raw.githubusercontent.com/80casper08/Hardtest2.0/main/images/2.jpg",
-        "options": [
-            ("Антена", True),
-            ("Кнопка", True),
-            ("Світлодіод", False),
-            ("Кварцовий резонатор", True)
-        ]
-    },
-    {
-        "text": "3) Яке правильне положення QR-коду на платі перед тестом DoorProtect?",
-        "image": "https://raw.githubusercontent.com/80casper08/Hardtest2.0/main/images/3.jpg",
-        "options": [
-            ("2", True),
-            ("1", False),
-            ("Будь-яке", False),
-            ("QR не потрібен", False)
-        ]
-    },
-    {
-        "text": "4) В якому випадку правильно поклеєний QR-код на плату WaterStop MBR?",
-        "image": "https://raw.githubusercontent.com/80casper08/Hardtest2.0/main/images/4.jpg",
-        "options": [
-            ("1", False),
-            ("2", True),
-            ("QR не клеїться", False),
-            ("Можна обидва варіанти", False)
-        ]
-    },
-    {
-        "text": "5) В якому випадку правильно поклеєний QR-код на плату Hub Hybrid?",
-        "image": "https://raw.githubusercontent.com/80casper08/Hardtest2.0/main/images/5.jpg",
-        "options": [
-            ("1", True),
-            ("2", False),
-            ("QR не клеїться", False),
-            ("Будь-який варіант", False)
-        ]
-    },
-    {
-        "text": "6) В якому випадку правильно поклеєний QR-код на плату LifeQuality?",
-        "image": "https://raw.githubusercontent.com/80casper08/Hardtest2.0/main/images/6.jpg",
-        "options": [
-            ("1", True),
-            ("2", False),
-            ("3", False),
-            ("4", False)
-        ]
-    },
-    {
-        "text": "7) В якому випадку правильно поклеєний QR-код на плату Hub?",
-        "image": "https://raw.githubusercontent.com/80casper08/Hardtest2.0/main/images/7.jpg",
-        "options": [
-            ("1", True),
-            ("2", True),
-            ("QR не клеїться", False),
-            ("Жоден", False)
-        ]
-    },
-    {
-        "text": "8) Чи дозволяється такий варіант накриття захисного ковпачка на платі Multitransmitter?",
-        "image": "https://raw.githubusercontent.com/80casper08/Hardtest2.0/main/images/8.jpg",
-        "options": [
-            ("Так", True),
-            ("Ні", False),
-            ("Можливо", False),
-            ("Тільки за інструкцією", False)
-        ]
-    },
-    {
-        "text": "9) В якому випадку правильно поклеєний QR-код на плату LightSwitch PWR?",
-        "image": "https://raw.githubusercontent.com/80casper08/Hardtest2.0/main/images/9.jpg",
-        "options": [
-            ("1", False),
-            ("2", True),
-            ("QR не клеїться", False),
-            ("Жоден", False)
-        ]
-    },
-    {
-        "text": "10) В якому випадку правильно поклеєний QR-код на плату KPC.BOT?",
-        "image": "https://raw.githubusercontent.com/80casper08/Hardtest2.0/main/images/10.jpg",
-        "options": [
-            ("1", False),
-            ("2", True),
-            ("3", False),
-            ("QR не клеїться", False)
-        ]
-    }
-]
-
-questions += [
-    {
-        "text": "11) В якому випадку правильно поклеєний QR-код на плату uartBridge?",
-        "image": "https://raw.githubusercontent.com/80casper08/Hardtest2.0/main/images/11.jpg",
-        "options": [
-            ("1", False),
-            ("2", True),
-            ("QR не клеїться", False),
-            ("Жоден", False)
-        ]
-    },
-    {
-        "text": "12) В якому випадку правильно поклеєний QR-код на плату MotionProtect Outdoor?",
-        "image": "https://raw.githubusercontent.com/80casper08/Hardtest2.0/main/images/12.jpg",
-        "options": [
-            ("1", True),
-            ("2", False),
-            ("3", False),
-            ("QR не клеїться", False)
-        ]
-    },
-    {
-        "text": "13) Яких елементів не вистачає на платі MotionCam?",
-        "image": "https://raw.githubusercontent.com/80casper08/Hardtest2.0/main/images/13.jpg",
-        "options": [
-            ("Електролітичні конденсатори", True),
-            ("Фототранзистор", True),
-            ("Антена", False),
-            ("Світлодіод", False)
-        ]
-    },
-    {
-        "text": "14) В якому випадку правильно поклеєний QR-код на плату ReX?",
-        "image": "https://raw.githubusercontent.com/80casper08/Hardtest2.0/main/images/14.jpg",
-        "options": [
-            ("1", True),
-            ("2", False),
-            ("3", False),
-            ("4", False)
-        ]
-    },
-    {
-        "text": "15) Яких елементів не вистачає на платі Hub Hybrid 4G?",
-        "image": "https://raw.githubusercontent.com/80casper08/Hardtest2.0/main/images/15.jpg",
-        "options": [
-            ("Розʼєм SIM холдера", True),
-            ("Клема акумуляторної батареї", True),
-            ("Тампер", False),
-            ("Кварцовий резонатор", False)
-        ]
-    }
-  ]
-questions += [
-    {
-        "text": "16) Яких елементів не вистачає на платі GPv10?",
-        "image": "https://raw.githubusercontent.com/80casper08/Hardtest2.0/main/images/16.jpg",
-        "options": [
-            ("Вмикач", True),
-            ("Клема", True),
-            ("Світлодіод", False),
-            ("Антена", False)
-        ]
-    },
-    {
-        "text": "17) В якому випадку неправильно поклеєний QR-код на плату Relay?",
-        "image": "https://raw.githubusercontent.com/80casper08/Hardtest2.0/main/images/17.jpg",
-        "options": [
-            ("2", True),
-            ("1", False),
-            ("Обидва правильні", False),
-            ("QR не клеїться", False)
-        ]
-    },
-    {
-        "text": "18) В якому випадку правильно поклеєний QR-код на плату StreetSiren?",
-        "image": "https://raw.githubusercontent.com/80casper08/Hardtest2.0/main/images/18.jpg",
-        "options": [
-            ("1", True),
-            ("2", False),
-            ("Будь-який варіант", False),
-            ("QR не клеїться", False)
-        ]
-    },
-    {
-        "text": "19) Яких елементів не вистачає на платі NVR?",
-        "image": "https://raw.githubusercontent.com/80casper08/Hardtest2.0/main/images/19.jpg",
-        "options": [
-            ("ЕК (дроселі із крихким керамічним корпусом)", True),
-            ("SIM холдер", False),
-            ("Клема живлення", False),
-            ("Антена", False)
-        ]
-    }
-]
-questions += [
-    {
-        "text": "20) Як для MotionProtect Outdoor правильно закріпляти решту QR-коду + CE для передачі плати на складання?",
-        "image": "https://raw.githubusercontent.com/80casper08/Hardtest2.0/main/images/20.jpg",
-        "options": [
-            ("Варіант 1", True),
-            ("Варіант 2", False),
-            ("Будь-який варіант", False),
-            ("QR не клеїться", False)
-        ]
-    },
-    {
-        "text": "21) В якому випадку правильно поклеєний QR-код на плату KeyPad?",
-        "image": "https://raw.githubusercontent.com/80casper08/Hardtest2.0/main/images/21.jpg",
-        "options": [
-            ("1", False),
-            ("2", True),
-            ("QR не клеїться", False),
-            ("Будь-який варіант", False)
-        ]
-    },
-    {
-        "text": "22) В якому випадку правильно поклеєний QR-код на плату DoubleButton?",
-        "image": "https://raw.githubusercontent.com/80casper08/Hardtest2.0/main/images/22.jpg",
-        "options": [
-            ("1", True),
-            ("2", False),
-            ("3", False),
-            ("Будь-який варіант", False)
-        ]
-    },
-    {
-        "text": "23) Яких елементів не вистачає на платі PanicButton?",
-        "image": "https://raw.githubusercontent.com/80casper08/Hardtest2.0/main/images/23.jpg",
-        "options": [
-            ("Світлодіод", True),
-            ("Кнопка", False),
-            ("Антена", False),
-            ("Холдер батарейки", False)
-        ]
-    }
-]
-questions += [
-    {
-        "text": "24) В якому випадку правильно поклеєний QR-код на плату DualCurtain Outdoor?",
-        "image": "https://raw.githubusercontent.com/80casper08/Hardtest2.0/main/images/24.jpg",
-        "options": [
-            ("1", False),
-            ("2", True),
-            ("Будь-який варіант", False),
-            ("QR не потрібен", False)
-        ]
-    },
-    {
-        "text": "25) В якому випадку правильно поклеєний QR-код на плату Socket?",
-        "image": "https://raw.githubusercontent.com/80casper08/Hardtest2.0/main/images/25.jpg",
-        "options": [
-            ("1", True),
-            ("2", False),
-            ("QR не клеїться", False),
-            ("Будь-який варіант", False)
-        ]
-    },
-    {
-        "text": "26) Яких елементів не вистачає на платі WaterStop PWB?",
-        "image": "https://raw.githubusercontent.com/80casper08/Hardtest2.0/main/images/26.jpg",
-        "options": [
-            ("Холдер контактних клем", True),
-            ("Кнопка", False),
-            ("Світлодіод", False),
-            ("Антена", False)
-        ]
-    },
-    {
-        "text": "27) В якому випадку правильно поклеєний QR-код на плату WaterStop PWB?",
-        "image": "https://raw.githubusercontent.com/80casper08/Hardtest2.0/main/images/27.jpg",
-        "options": [
-            ("1", True),
-            ("2", False),
-            ("Обидва варіанти правильні", False),
-            ("QR не клеїться", False)
-        ]
-    }
-]
-questions += [
-    {
-        "text": "28) Яку плату можна зашити як MotionProtect?",
-        "image": "https://raw.githubusercontent.com/80casper08/Hardtest2.0/main/images/28.jpg",
-        "options": [
-            ("1", False),
-            ("2", True),
-            ("Будь-який варіант", False),
-            ("QR не клеїться", False)
-        ]
-    },
-    {
-        "text": "29) В якому випадку правильно поклеєний QR-код на плату Hub 2?",
-        "image": "https://raw.githubusercontent.com/80casper08/Hardtest2.0/main/images/29.jpg",
-        "options": [
-            ("1", True),
-            ("2", False),
-            ("3", False),
-            ("QR не клеїться", False)
-        ]
-    },
-    {
-        "text": "30) В якому випадку правильно поклеєний QR-код на плату ocBridge Plus?",
-        "image": "https://raw.githubusercontent.com/80casper08/Hardtest2.0/main/images/30.jpg",
-        "options": [
-            ("1", True),
-            ("2", False),
-            ("Будь-який варіант", False),
-            ("QR не клеїться", False)
-        ]
-    },
-    {
-        "text": "31) В якому випадку правильно поклеєний QR-код на плату LightSwitch MBR?",
-        "image": "https://raw.githubusercontent.com/80casper08/Hardtest2.0/main/images/31.jpg",
-        "options": [
-            ("1", True),
-            ("2", False),
-            ("QR не клеїться", False),
-            ("Будь-який варіант", False)
-        ]
-    },
-    {
-        "text": "32) Яких елементів не вистачає LightSwitch MBR?",
-        "image": "https://raw.githubusercontent.com/80casper08/Hardtest2.0/main/images/32.jpg",
-        "options": [
-            ("1", True),
-            ("2", False),
-            ("QR не клеїться", False),
-            ("Обидва варіанти правильні", False)
-        ]
-    },
-    {
-        "text": "33) В якому випадку правильно поклеєний QR-код на плату HomeSiren?",
-        "image": "https://raw.githubusercontent.com/80casper08/Hardtest2.0/main/images/33.jpg",
-        "options": [
-            ("1", True),
-            ("2", False),
-            ("QR не клеїться", False),
-            ("Обидва варіанти правильні", False)
-        ]
-    }
-]
-questions += [
-    {
-        "text": "34) В якому випадку правильно поклеєний відповідний QR-код на плату PWB?",
-        "image": "https://raw.githubusercontent.com/80casper08/Hardtest2.0/main/images/34.jpg",
-        "options": [
-            ("1 (Success)", False),
-            ("2 (QR)", False),
-            ("3 (PWB+QR)", True),
-            ("Усі варіанти правильні", False)
-        ]
-    },
-    {
-        "text": "35) В якому випадку правильно поклеєний QR-код на плату NVR?",
-        "image": "https://raw.githubusercontent.com/80casper08/Hardtest2.0/main/images/35.jpg",
-        "options": [
-            ("1", False),
-            ("2", True),
-            ("3", False),
-            ("4", False)
-        ]
-    },
-    {
-        "text": "36) В якому випадку правильно поклеєний QR-код на плату MultiTransmitter?",
-        "image": "https://raw.githubusercontent.com/80casper08/Hardtest2.0/main/images/36.jpg",
-        "options": [
-            ("1", True),
-            ("2", False),
-            ("QR не клеїться", False),
-            ("Будь-який варіант", False)
-        ]
-    },
-    {
-        "text": "37) В якому випадку правильно поклеєний QR-код на плату KeypadCombi?",
-        "image": "https://raw.githubusercontent.com/80casper08/Hardtest2.0/main/images/37.jpg",
-        "options": [
-            ("1", True),
-            ("2", False),
-            ("3", False),
-            ("4", False)
-        ]
-    },
-    {
-        "text": "38) В якому випадку правильно поклеєний QR-код на плату?",
-        "image": "https://raw.githubusercontent.com/80casper08/Hardtest2.0/main/images/38.jpg",
-        "options": [
-            ("1", False),
-            ("2", True),
-            ("QR не клеїться", False),
-            ("Будь-який варіант", False)
-        ]
-    }
-]
-questions += [
-    {
-        "text": "39) Для чого потрібні ці комплектуючі для Hub Hybrid?",
-        "image": "https://raw.githubusercontent.com/80casper08/Hardtest2.0/main/images/39.jpg",
-        "options": [
-            ("Для захисту вивідних контактів роз'єму 220V", True),
-            ("Для підключення кабелів живлення", False),
-            ("Для кріплення кришки корпусу", False),
-            ("Для тестування плати на стенді", False)
-        ]
-    },
-    {
-        "text": "40) В якому випадку неправильно поклеєний QR-код на плату KeypadPlus?",
-        "image": "https://raw.githubusercontent.com/80casper08/Hardtest2.0/main/images/40.jpg",
-        "options": [
-            ("1", False),
-            ("2", True),
-            ("QR не клеїться", False),
-            ("Обидва варіанти правильні", False)
-        ]
-    },
-    {
-        "text": "41) Яких елементів не вистачає на платі CombiProtect?",
-        "image": "https://raw.githubusercontent.com/80casper08/Hardtest2.0/main/images/41.jpg",
-        "options": [
-            ("Світлодіод", True),
-            ("Клема", True),
-            ("Тампер", True),
-            ("PIR-сенсор", True)
-        ]
-    },
-    {
-        "text": "42) Яких елементів не вистачає на платі Hub Plus?",
-        "image": "https://raw.githubusercontent.com/80casper08/Hardtest2.0/main/images/42.jpg",
-        "options": [
-            ("Роз'єм SIM-holder", True),
-            ("Світлодіод", True),
-            ("Антена", False),
-            ("Тампер", False)
-        ]
-    },
-    {
-        "text": "43) В якому випадку правильно поклеєний QR-код на плату PWBv4?",
-        "image": "https://raw.githubusercontent.com/80casper08/Hardtest2.0/main/images/43.jpg",
-        "options": [
-            ("1", True),
-            ("2", False),
-            ("Обидва варіанти правильні", False),
-            ("QR не клеїться", False)
-        ]
-    }
-]
+# 📚 Питання — готовий знімок у questions.json
+with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "questions.json"), encoding="utf-8") as f:
+    questions = json.load(f)
+mark_phase("завантаження питань")
+
+first_update_done = False
+
+@dp.update.outer_middleware()
+async def measure_first_update(handler, event, data):
+    global first_update_done
+    result = await handler(event, data)
+    if not first_update_done:
+        first_update_done = True
+        boot_log.info("⏱ Перше оновлення оброблено через %.0f мс від старту",
+                      (time.perf_counter() - BOOT_STARTED) * 1000)
+    return result
 
 @dp.message(F.text.startswith("/start"))
 async def start_quiz(message: types.Message, state: FSMContext):
@@ -623,7 +218,13 @@ async def restart_quiz(callback: CallbackQuery, state: FSMContext):
     await send_question(callback.message.chat.id, state)
 
 # 🚀 Запуск
+async def warm_up():
+    """Паралельно відкриває кілька з'єднань з Bot API, щоб перший апдейт не чекав на TLS."""
+    await asyncio.gather(bot.me(), *(bot.get_me() for _ in range(WARM_CONNECTIONS - 1)))
+
 async def main():
+    await warm_up()
+    mark_phase(f"прогрів з'єднань ({WARM_CONNECTIONS})")
     await dp.start_polling(bot)
 
 if __name__ == "__main__":